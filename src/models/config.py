@@ -12,10 +12,11 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class PagesConfig(BaseModel):
@@ -30,24 +31,18 @@ class PagesConfig(BaseModel):
     first: int
     last: int
 
-    @field_validator("last", mode="before")
-    @classmethod
-    def check_last_not_less_first(cls, v: int, info: dict[str, Any]) -> int:
+    @model_validator(mode="after")
+    def check_last_not_less_first(self) -> PagesConfig:
         """Проверяет, что last не меньше first.
 
-        :param v: значение last для валидации
-        :type v: int
-        :param info: информация о валидации
-        :type info: dict[str, Any]
-        :return: проверенное значение last
-        :rtype: int
-        :raises ValueError: если last меньше first и first меньше 1
+        :return: проверенная конфигурация
+        :rtype: PagesConfig
+        :raises ValueError: если last меньше first
         """
-        first_value = info.data.get("first")
-        if v is not None and first_value is not None and v < first_value and first_value < 1:
-            error_message = f"'last' ({v}) cannot be less than 'first' ({first_value})"
+        if self.last < self.first:
+            error_message = f"'last' ({self.last}) cannot be less than 'first' ({self.first})"
             raise ValueError(error_message)
-        return v
+        return self
 
 
 class SaveConfig(BaseModel):
@@ -61,32 +56,19 @@ class SaveConfig(BaseModel):
     :vartype extension: str
     :ivar skip: сохранять ли статьи с ошибками
     :vartype skip: bool
+    :ivar resume: пропускать ли статьи, обработанные в прошлых запусках
+    :vartype resume: bool
     """
 
     file: str
     path: str
-    extension: str
+    extension: Literal["parquet", "feather", "arrow", "csv", "json", "jsonl", "jsonl.zst"]
     skip: bool
+    resume: bool = False
 
-    @field_validator("extension", mode="before")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Валидирует допустимые типы файлов.
-
-        :param v: расширение файла для валидации
-        :type v: str
-        :return: проверенное расширение файла
-        :rtype: str
-        :raises ValueError: если расширение не поддерживается
-        """
-        allowed_types = {"parquet", "csv", "json"}
-        if v not in allowed_types:
-            error_message = f"type must be one of {allowed_types}, got '{v}'"
-            raise ValueError(error_message)
-        return v
-
-    def get_path(self) -> Path:
-        """Формирует полный путь к файлу для сохранения.
+    @cached_property
+    def full_path(self) -> Path:
+        """Полный путь к файлу для сохранения, вычисляется один раз.
 
         :return: полный путь к файлу
         :rtype: Path
@@ -118,8 +100,9 @@ class HeadersConfig(BaseModel):
     connection: str | None = None
     referer: str | None = None
 
-    def build_headers(self) -> dict[str, str | None]:
-        """Собирает заголовки в словарь для HTTP-запросов.
+    @cached_property
+    def http_headers(self) -> dict[str, str | None]:
+        """Заголовки в виде словаря для HTTP-запросов, собираются один раз.
 
         :return: словарь с HTTP-заголовками
         :rtype: dict[str, str | None]
@@ -143,45 +126,14 @@ class LoggingConfig(BaseModel):
     :vartype output: str
     :ivar filename: имя файла для логирования
     :vartype filename: str
+    :ivar mmap: писать файл лога через отображение в память
+    :vartype mmap: bool
     """
 
-    level: str
-    output: str
+    level: Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    output: Literal["console", "file", "both"]
     filename: str | None = None
-
-    @field_validator("level", mode="before")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        """Валидирует уровень логирования.
-
-        :param v: уровень логирования для валидации
-        :type v: str
-        :return: проверенный уровень логирования
-        :rtype: str
-        :raises ValueError: если уровень не поддерживается
-        """
-        allowed_levels = {"NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v not in allowed_levels:
-            error_message = f"level must be one of {allowed_levels}, got '{v}'"
-            raise ValueError(error_message)
-        return v
-
-    @field_validator("output", mode="before")
-    @classmethod
-    def validate_output(cls, v: str) -> str:
-        """Валидирует тип вывода логов.
-
-        :param v: тип вывода для валидации
-        :type v: str
-        :return: проверенный тип вывода
-        :rtype: str
-        :raises ValueError: если тип вывода не поддерживается
-        """
-        allowed_outputs = {"console", "file", "both"}
-        if v not in allowed_outputs:
-            error_message = f"level must be one of {allowed_outputs}, got '{v}'"
-            raise ValueError(error_message)
-        return v
+    mmap: bool = False
 
 
 class SessionConfig(BaseModel):
@@ -216,10 +168,12 @@ class RequestConfig(BaseModel):
     :vartype max_delay: float
     :ivar batch_size: размер пакета запросов
     :vartype batch_size: int
-    :ivar max_workers: максимальное количество рабочих процессов
+    :ivar max_workers: максимальное количество процессов для разбора HTML
     :vartype max_workers: int
     :ivar buffer_size: размер буфера
     :vartype buffer_size: int
+    :ivar row_group_bytes: примерный размер группы строк Parquet в байтах
+    :vartype row_group_bytes: int
     :ivar timeout: таймаут запроса
     :vartype timeout: int
     :ivar session: настройки сессии
@@ -233,6 +187,7 @@ class RequestConfig(BaseModel):
     batch_size: int = Field(..., gt=0)
     max_workers: int = Field(..., gt=0)
     buffer_size: int = Field(..., gt=0)
+    row_group_bytes: int = Field(64 << 20, gt=0)
     timeout: int = Field(..., gt=0)
     session: SessionConfig
 
@@ -270,3 +225,28 @@ class ParserConfig(BaseModel):
             error_message = "If type of pages is str, it must be 'all'"
             raise ValueError(error_message)
         return self
+
+    @classmethod
+    def model_construct_trusted(cls, data: dict[str, Any]) -> ParserConfig:
+        """Собирает конфигурацию из ранее проверенных данных без валидации.
+
+        В отличие от ``model_construct`` вложенные модели тоже собираются через ``model_construct``.
+        Вызывать только для результата ``model_dump`` уже проверенной конфигурации: значения
+        не приводятся к типам, поэтому сырые данные из файла сюда передавать нельзя.
+
+        :param data: данные конфигурации
+        :type data: dict[str, Any]
+        :return: конфигурация без повторной валидации
+        :rtype: ParserConfig
+        """
+        request = dict(data["request"])
+        request["session"] = SessionConfig.model_construct(**request["session"])
+        headers = data.get("headers")
+        logging = data.get("logging")
+        return cls.model_construct(
+            pages=PagesConfig.model_construct(**data["pages"]),
+            save=SaveConfig.model_construct(**data["save"]),
+            request=RequestConfig.model_construct(**request),
+            headers=HeadersConfig.model_construct(**headers) if headers is not None else None,
+            logging=LoggingConfig.model_construct(**logging) if logging is not None else None,
+        )
@@ -0,0 +1,76 @@
+"""Модуль с моделью записи о статье.
+
+Содержит:
+- PostRecord: результат обработки одной статьи
+- POST_SCHEMA: Arrow-схема записей для колоночных форматов
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+
+
+@dataclass(slots=True)
+class PostRecord:
+    """Результат обработки статьи.
+
+    Обычный dataclass со слотами вместо словаря: записей в обработке одновременно много,
+    а слоты занимают заметно меньше памяти.
+
+    :ivar id: ID статьи
+    :vartype id: int
+    :ivar status: статус обработки (ok, not_found, fetch_error, error)
+    :vartype status: str
+    :ivar title: заголовок статьи
+    :vartype title: str | None
+    :ivar text: текст статьи
+    :vartype text: str | None
+    :ivar keywords: ключевые слова
+    :vartype keywords: list[str] | None
+    :ivar username: имя автора
+    :vartype username: str | None
+    :ivar hubs: хабы статьи
+    :vartype hubs: list[str] | None
+    :ivar time: дата и время публикации
+    :vartype time: str | None
+    :ivar reading_time: время чтения в минутах
+    :vartype reading_time: str | None
+    :ivar error: описание ошибки
+    :vartype error: str | None
+    """
+
+    id: int
+    status: str
+    title: str | None = None
+    text: str | None = None
+    keywords: list[str] | None = None
+    username: str | None = None
+    hubs: list[str] | None = None
+    time: str | None = None
+    reading_time: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Преобразует запись в словарь для экспорта.
+
+        :return: словарь с полями записи в порядке объявления
+        :rtype: dict[str, Any]
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+POST_SCHEMA: pa.Schema = pa.schema([
+    ("id", pa.int64()),
+    ("status", pa.string()),
+    ("title", pa.string()),
+    ("text", pa.string()),
+    ("keywords", pa.list_(pa.string())),
+    ("username", pa.string()),
+    ("hubs", pa.list_(pa.string())),
+    ("time", pa.string()),
+    ("reading_time", pa.string()),
+    ("error", pa.string()),
+])
@@ -3,31 +3,185 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import html
+import inspect
 import logging
-import random
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import numpy as np
+import orjson
 import yaml
-from bs4 import BeautifulSoup
+from pydantic import TypeAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 from src.models.config import ParserConfig
+from src.models.post import POST_SCHEMA, PostRecord
 from src.utils.exceptions import FetchPostError
 from src.utils.export import Exporter
 from src.utils.logger import setup_logger
+from src.utils.seen import SeenPosts
 
 if TYPE_CHECKING:
     import types
 
+    from selectolax.lexbor import LexborNode
+
     from src.models.config import HeadersConfig
 
 HTTP_OK: int = 200
 HTTP_530: int = 530
 HTTP_TOO_MANY_REQUESTS: int = 429
+# Статья удалена или не существует, повторный запрос вернет то же самое
+HTTP_NOT_FOUND_STATUSES: frozenset[int] = frozenset({404, 410})
+DELAYS_BUFFER_SIZE: int = 1 << 16
+RESULTS_QUEUE_BATCHES: int = 4
+ISO_DATETIME_LENGTH: int = 19
+KEYWORDS_SEPARATOR: re.Pattern[str] = re.compile(r",\s*")
+FINAL_STATUSES: frozenset[str] = frozenset({"ok", "not_found"})
+UTF8_CHARSETS: frozenset[str] = frozenset({"utf-8", "utf8"})
+
+POST_BODY_ID: str = "post-content-body"
+POST_BODY_MARKER: str = f'id="{POST_BODY_ID}"'
+POST_BODY_MARKER_BYTES: bytes = POST_BODY_MARKER.encode()
+HUB_LINK_CLASS: str = "tm-hubs-list__link"
+ARTICLE_BODY_CLASS: str = "article-formatted-body"
+USERNAME_CLASS: str = "tm-user-info__username"
+READING_TIME_SUFFIX: str = " мин"
+POST_FIELDS_SELECTOR: str = (
+    f"div#{POST_BODY_ID}, title, div.{ARTICLE_BODY_CLASS}, meta[name='keywords'], "
+    f"a.{USERNAME_CLASS}, a.{HUB_LINK_CLASS}, time, span.tm-article-reading-time__label"
+)
+
+# aiohttp распаковывает br только при установленном Brotli, поэтому br запрашивается лишь в этом случае
+ACCEPT_ENCODING: str = "gzip, deflate, br" if find_spec("brotli") or find_spec("brotlicffi") else "gzip, deflate"
+
+
+# SafeLoader на базе libyaml, если PyYAML поддерживает libyaml
+YamlLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _config_adapter() -> TypeAdapter[ParserConfig]:
+    """Возвращает TypeAdapter для ParserConfig, создаваемый один раз на процесс.
+
+    :return: TypeAdapter конфигурации парсера
+    :rtype: TypeAdapter[ParserConfig]
+    """
+    return TypeAdapter(ParserConfig)
+
+
+def clean_text(text: str) -> str:
+    """Экранирует символы в тексте.
+
+    :param text: HTML-контент статьи
+    :type text: str
+    """
+    if not text:
+        return ""
+    text = html.unescape(str(text))
+    text = re.sub(r"[\r\n]+", " ", text)
+    text = re.sub(r"\t+", " ", text)
+    text = text.replace('"', '""')
+    text = re.sub(r"[„“”«»]", '"', text)
+    text = re.sub(r"[ ]+", " ", text)
+    text = text.replace("\\", "/")
+
+    return text.strip()
+
+
+def format_time(value: str) -> str:
+    """Приводит ISO-дату из атрибута datetime к виду YYYY-MM-DD HH:MM:SS.
+
+    Habr отдает даты вида 2024-05-13T10:21:33.000Z, поэтому нужная строка вырезается срезом,
+    а через datetime разбираются только нестандартные значения.
+
+    :param value: Значение атрибута datetime
+    :type value: str
+    :return: Дата и время в формате YYYY-MM-DD HH:MM:SS
+    :rtype: str
+    """
+    if len(value) >= ISO_DATETIME_LENGTH and value[10] == "T":
+        return f"{value[:10]} {value[11:19]}"
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def parse_post(text: bytes | str, post_id: int) -> PostRecord:
+    """Парсит HTML-контент статьи.
+
+    Функция вынесена на уровень модуля, чтобы ее можно было выполнять в пуле процессов.
+    Байты передаются парсеру как есть и разбираются как UTF-8.
+
+    :param text: HTML-контент статьи
+    :type text: bytes | str
+    :param post_id: ID статьи
+    :type post_id: int
+    :return: Запись с распарсенными данными статьи
+    :rtype: PostRecord
+    """
+    # Несуществующие статьи отсеиваются по сырому HTML, без построения дерева
+    has_body = POST_BODY_MARKER_BYTES in text if isinstance(text, bytes) else POST_BODY_MARKER in text
+    if not has_body:
+        return PostRecord(post_id, "not_found")
+
+    # Нужные узлы собираются за один обход дерева, в порядке документа.
+    # Условия полей проверяются независимо: один узел может заполнить сразу несколько полей.
+    # Узел, подходящий под несколько селекторов группы, lexbor возвращает несколько раз подряд
+    tree = LexborHTMLParser(text)
+    nodes: dict[str, LexborNode] = {}
+    hubs: list[str] = []
+    previous_id: int | None = None
+    for node in tree.css(POST_FIELDS_SELECTOR):
+        if not node.tag or node.mem_id == previous_id:
+            continue
+        previous_id = node.mem_id
+        if node.tag in {"div", "a"}:
+            classes = (node.attributes.get("class") or "").split()
+            if node.tag == "div" and node.id == POST_BODY_ID:
+                nodes.setdefault("body", node)
+            if node.tag == "div" and ARTICLE_BODY_CLASS in classes:
+                nodes.setdefault("article", node)
+            if node.tag == "a" and HUB_LINK_CLASS in classes:
+                hubs.append(node.text(strip=True))
+            if node.tag == "a" and USERNAME_CLASS in classes:
+                nodes.setdefault("a", node)
+        else:
+            nodes.setdefault(node.tag, node)
+
+    if "body" not in nodes:
+        return PostRecord(post_id, "not_found")
+
+    title = nodes.get("title")
+    article = nodes.get("article")
+    keywords = nodes.get("meta")
+    keywords_content = keywords.attributes.get("content") if keywords else None
+    username = nodes.get("a")
+    time = nodes.get("time")
+    time_content = time.attributes.get("datetime") if time else None
+    reading_time = nodes.get("span")
+
+    return PostRecord(
+        id=post_id,
+        status="ok",
+        title=title.text(strip=True) if title else None,
+        text=clean_text(article.text(strip=True)) if article else None,
+        keywords=KEYWORDS_SEPARATOR.split(keywords_content) if keywords_content else None,
+        username=username.text(strip=True) if username else None,
+        hubs=hubs,
+        time=format_time(time_content) if time_content else None,
+        reading_time=reading_time.text(strip=True).removesuffix(READING_TIME_SUFFIX) if reading_time else None,
+    )
 
 
 class HabrParser:
@@ -37,10 +191,34 @@ class HabrParser:
     :vartype BASE_URL: str
     :cvar BASE_CONFIG_PATH: Путь к файлу конфигурации по умолчанию
     :vartype BASE_CONFIG_PATH: Path
+    :cvar CONFIG_CACHE_PATH: Папка с отметками об успешно провалидированных конфигурациях
+    :vartype CONFIG_CACHE_PATH: Path
     """
 
+    __slots__ = (
+        "_batch_size",
+        "_delay_index",
+        "_delays",
+        "_max_delay",
+        "_min_delay",
+        "_parse_pool",
+        "_retry_attempts",
+        "_rng",
+        "_skip",
+        "config",
+        "headers",
+        "last_request_time",
+        "log",
+        "request_count",
+        "save_path",
+        "seen",
+        "semaphore",
+        "session",
+    )
+
     BASE_URL: str = "https://habr.com/ru/articles/"
     BASE_CONFIG_PATH: Path = Path(__file__).parent.parent.joinpath("config.yaml")
+    CONFIG_CACHE_PATH: Path = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache").joinpath("habr_parser")
 
     def __init__(self, config_path: str | Path | None = None) -> None:
         """Инициализация параметров.
@@ -49,17 +227,88 @@ class HabrParser:
         :type config_path: str | Path | None
         """
         path = Path(config_path) if config_path else self.BASE_CONFIG_PATH
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        self.config: ParserConfig = ParserConfig(**data)
+        self.config: ParserConfig = self.__load_config(path)
         setup_logger(self.config.logging)
         self.log: logging.Logger = logging.getLogger(__name__)
         self.session: aiohttp.ClientSession | None = None
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(self.config.request.max_concurrent_requests)
         self.last_request_time: float = 0
         self.request_count: int = 0
+
+        # Значения из конфига, которые читаются на каждый запрос, кэшируются простыми атрибутами
+        headers_config: HeadersConfig | None = self.config.headers
+        headers = headers_config.http_headers if headers_config else {}
+        self.headers: dict[str, str] = {name: value for name, value in headers.items() if value is not None}
+        self.headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+        self.save_path: Path = self.config.save.full_path
+        self.seen: SeenPosts | None = None
+        if self.config.save.resume:
+            self.seen = SeenPosts(self.save_path.with_name(f".{self.save_path.name}.seen"))
+            self.save_path = self.__free_path(self.save_path)
+        self._min_delay: float = self.config.request.min_delay
+        self._max_delay: float = self.config.request.max_delay
+        self._retry_attempts: int = self.config.request.retry_attempts
+        self._batch_size: int = self.config.request.batch_size
+        self._skip: bool = self.config.save.skip
+
+        # Случайные задержки генерируются заранее одним вызовом и расходуются по очереди
+        self._rng: np.random.Generator = np.random.default_rng()
+        self._delays: np.ndarray = self._rng.uniform(self._min_delay, self._max_delay, DELAYS_BUFFER_SIZE)
+        self._delay_index: int = 0
+
+        # Разбор HTML нагружает CPU, поэтому выполняется в отдельных процессах, не блокируя event loop.
+        # Пул живет столько же, сколько HTTP-сессия
+        self._parse_pool: ProcessPoolExecutor | None = None
         self.log.info("HabrParser initialized")
 
+    def __load_config(self, path: Path) -> ParserConfig:
+        """Загружает конфигурацию, пропуская валидацию для уже проверенных файлов.
+
+        После успешной валидации в CONFIG_CACHE_PATH создается отметка, имя которой - хэш содержимого
+        файла и исходников моделей конфигурации, а содержимое - уже проверенные и приведенные к типам
+        данные. Если отметка существует, конфигурация собирается из них через
+        ``ParserConfig.model_construct_trusted`` без валидации, поэтому ведет себя так же, как после
+        валидации. Любое изменение файла или моделей меняет хэш, поэтому без валидации загружаются
+        только байт-в-байт совпадающие конфигурации.
+        Доверие держится на папке кэша: тот, кто может писать в нее, может отключить валидацию.
+
+        :param path: Путь к файлу конфигурации
+        :type path: Path
+        :return: Конфигурация парсера
+        :rtype: ParserConfig
+        """
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw)
+        digest.update(Path(inspect.getfile(ParserConfig)).read_bytes())
+        marker = self.CONFIG_CACHE_PATH / f"{digest.hexdigest()}.validated"
+        with contextlib.suppress(OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return ParserConfig.model_construct_trusted(orjson.loads(marker.read_bytes()))
+
+        data = yaml.load(raw, Loader=YamlLoader)  # noqa: S506
+        config = _config_adapter().validate_python(data)
+        with contextlib.suppress(OSError):
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.write_bytes(orjson.dumps(config.model_dump(mode="json")))
+        return config
+
+    @staticmethod
+    def __free_path(path: Path) -> Path:
+        """Возвращает путь, не затирающий результаты прошлых запусков.
+
+        Если файл уже существует, к имени добавляется номер: data.csv -> data_1.csv -> data_2.csv.
+
+        :param path: Путь для сохранения
+        :type path: Path
+        :return: Путь к несуществующему файлу
+        :rtype: Path
+        """
+        name, _, extension = path.name.partition(".")
+        candidate, part = path, 0
+        while candidate.exists():
+            part += 1
+            candidate = path.with_name(f"{name}_{part}.{extension}")
+        return candidate
+
     async def __aenter__(self) -> HabrParser:
         """Асинхронный контекстный менеджер для инициализации сессии.
 
@@ -89,7 +338,9 @@ class HabrParser:
         return None
 
     async def init_session(self) -> None:
-        """Инициализирует HTTP-сессию с настройками соединения."""
+        """Инициализирует HTTP-сессию с настройками соединения и пул процессов для разбора HTML."""
+        if self._parse_pool is None:
+            self._parse_pool = self.__create_parse_pool()
         if self.session is None or self.session.closed:
             connector = aiohttp.TCPConnector(
                 limit=self.config.request.session.limit,
@@ -105,191 +356,246 @@ class HabrParser:
             self.log.debug("Session initialized with rate limiting")
 
     async def close_session(self) -> None:
-        """Закрывает HTTP-сессию."""
+        """Закрывает HTTP-сессию и пул процессов для разбора HTML."""
         if self.session and not self.session.closed:
             await self.session.close()
+        if self._parse_pool is not None:
+            pool, self._parse_pool = self._parse_pool, None
+            await asyncio.to_thread(pool.shutdown, cancel_futures=True)
 
-    @property
-    def save_path(self) -> Path:
-        """Возвращает путь для сохранения данных.
+    def __create_parse_pool(self) -> ProcessPoolExecutor:
+        """Создает пул процессов для разбора HTML.
 
-        :return: Путь для сохранения
-        :rtype: Path
+        :return: Пул процессов
+        :rtype: ProcessPoolExecutor
         """
-        return self.config.save.get_path()
-
-    @property
-    def headers(self) -> dict[str, str | None]:
-        """Возвращает заголовки HTTP-запросов.
-
-        :return: Словарь заголовков
-        :rtype: dict[str, str | None]
+        # fork процесса, где уже работают event loop и потоки логгера, небезопасен
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(
+            max_workers=min(self.config.request.max_workers, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(start_method),
+        )
+
+    async def __parse(self, content: bytes | str, post_id: int) -> PostRecord:
+        """Разбирает статью в пуле процессов, пересоздавая пул, если один из его процессов упал.
+
+        Упавший процесс ломает весь пул, поэтому первая заметившая это задача заменяет его новым,
+        а все задачи, чей разбор был прерван, повторяют его один раз уже в новом пуле.
+
+        :param content: HTML-контент статьи
+        :type content: bytes | str
+        :param post_id: ID статьи
+        :type post_id: int
+        :return: Запись с распарсенными данными статьи
+        :rtype: PostRecord
         """
-        headers_config: HeadersConfig | None = self.config.headers
-        return headers_config.build_headers() if headers_config else {}
+        loop = asyncio.get_running_loop()
+        pool = self._parse_pool
+        try:
+            return await loop.run_in_executor(pool, parse_post, content, post_id)
+        except BrokenProcessPool:
+            if pool is None or self._parse_pool is not pool:
+                self.log.warning("Retrying post %s in the restarted parse pool", post_id)
+            else:
+                self.log.warning("Parse pool broke on post %s, restarting it", post_id)
+                self._parse_pool = self.__create_parse_pool()
+                await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+        return await loop.run_in_executor(self._parse_pool, parse_post, content, post_id)
 
     async def __delay_request(self) -> None:
         """Добавляет случайную задержку между запросами."""
-        await asyncio.sleep(random.uniform(self.config.request.min_delay, self.config.request.max_delay))  # noqa: S311
-
-    async def fetch_post(self, post_id: int) -> str:
+        if self._delay_index == DELAYS_BUFFER_SIZE:
+            self._delays = self._rng.uniform(self._min_delay, self._max_delay, DELAYS_BUFFER_SIZE)
+            self._delay_index = 0
+        delay = self._delays[self._delay_index]
+        self._delay_index += 1
+        await asyncio.sleep(float(delay))
+
+    async def fetch_post(self, post_id: int) -> bytes | str:
         """Получает HTML-контент с retry и задержками.
 
+        Тело ответа возвращается байтами, без декодирования в строку. Строкой возвращаются
+        только страницы, для которых сервер явно указал кодировку, отличную от UTF-8.
+
         :param post_id: ID статьи для получения
         :type post_id: int
         :return: HTML-контент статьи
-        :rtype: str
+        :rtype: bytes | str
         :raises FetchPostError: Если не удалось получить статью после всех попыток
         """
         async with self.semaphore:
             await self.__delay_request()
 
             url = f"{self.BASE_URL}{post_id}"
-            self.log.info(f"Fetching post {post_id}")
+            self.log.info("Fetching post %s", post_id)
 
-            for attempt in range(self.config.request.retry_attempts):
+            for attempt in range(self._retry_attempts):
                 try:
                     async with self.session.get(url) as response:
                         if response.status == HTTP_OK:
-                            text = await response.text()
-                            self.log.info(f"Successfully fetched post {post_id}")
-                            return text
+                            body = await response.read()
+                            self.log.info("Successfully fetched post %s", post_id)
+                            charset = response.charset
+                            if charset and charset.lower() not in UTF8_CHARSETS:
+                                return body.decode(charset, errors="replace")
+                            return body
                         if response.status == HTTP_530:
-                            self.log.warning(f"503 error for post {post_id}, attempt {attempt + 1}")
+                            self.log.warning("503 error for post %s, attempt %s", post_id, attempt + 1)
                             await self.__delay_request()
                             continue
                         if response.status == HTTP_TOO_MANY_REQUESTS:
-                            self.log.warning(f"429 Rate Limited for post {post_id}")
+                            self.log.warning("429 Rate Limited for post %s", post_id)
                             await self.__delay_request()
                             continue
                         error_message = f"HTTP {response.status}"
-                        raise FetchPostError(post_id, error_message)
+                        raise FetchPostError(post_id, error_message, response.status)
 
                 except aiohttp.ClientError as e:
-                    self.log.warning(f"Client error, retrying: {e!s}")
+                    self.log.warning("Client error, retrying: %s", e)
                     await self.__delay_request()
 
             error_message = "Max retries exceeded"
             raise FetchPostError(post_id, error_message)
 
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """Экранирует символы в тексте.
-
-        :param text: HTML-контент статьи
-        :type text: str
-        """
-        if not text:
-            return ""
-        text = html.unescape(str(text))
-        text = re.sub(r"[\r\n]+", " ", text)
-        text = re.sub(r"\t+", " ", text)
-        text = text.replace('"', '""')
-        text = re.sub(r"[„“”«»]", '"', text)
-        text = re.sub(r"[ ]+", " ", text)
-        text = text.replace("\\", "/")
-
-        return text.strip()
-
-    def parse_post(self, text: str) -> dict[str, Any]:
-        """Парсит HTML-контент статьи.
-
-        :param text: HTML-контент статьи
-        :type text: str
-        :return: Словарь с распарсенными данными статьи
-        :rtype: dict[str, Any]
-        """
-        soup = BeautifulSoup(text, "lxml")
-        data: dict[str, Any] = {}
-
-        if not soup.find("div", {"id": "post-content-body"}):
-            data["status"] = "not_found"
-        else:
-            data["status"] = "ok"
-            title = soup.find("title")
-            data["title"] = title.get_text(strip=True) if title else None
-
-            article = soup.find("div", {"class": "article-formatted-body"})
-            data["text"] = self.clean_text(article.get_text(strip=True)) if article else None
-
-            keywords = soup.find("meta", attrs={"name": "keywords"})
-            keywords_content = keywords.get("content") if keywords else None
-            data["keywords"] = keywords_content.split(", ") if keywords_content else None
-
-            username = soup.find("a", {"class": "tm-user-info__username"})
-            data["username"] = username.get_text(strip=True) if username else None
-
-            hubs = []
-            for link in soup.find_all("a", class_="tm-hubs-list__link"):
-                hub_name = link.get_text(strip=True) if link else None
-                hubs.append(hub_name)
-            data["hubs"] = hubs
-
-            time = soup.find("time")
-            data["time"] = datetime.fromisoformat(
-                time.get("datetime").replace("Z", "+00:00"),
-                ).strftime("%Y-%m-%d %H:%M:%S") if time else None
-
-            reading_time = soup.find("span", {"class": "tm-article-reading-time__label"})
-            data["reading_time"] = reading_time.get_text(strip=True)[:-4] if reading_time else None
-
-        return data
-
-    async def get_post_data(self, post_id: int) -> dict[str, Any]:
+    async def get_post_data(self, post_id: int) -> PostRecord:
         """Обрабатывает статью с обработкой ошибок.
 
         :param post_id: ID статьи для обработки
         :type post_id: int
-        :return: Словарь с данными статьи или информацией об ошибке
-        :rtype: dict[str, Any]
+        :return: Запись с данными статьи или информацией об ошибке
+        :rtype: PostRecord
         """
         try:
-            text = await self.fetch_post(post_id)
-            data = self.parse_post(text)
+            content = await self.fetch_post(post_id)
+            record = await self.__parse(content, post_id)
         except FetchPostError as e:
-            self.log.error(f"Failed to fetch post {post_id}: {e}")  # noqa: TRY400
-            return {"id": post_id, "status": "fetch_error", "error": str(e)}
+            if e.http_status in HTTP_NOT_FOUND_STATUSES:
+                self.log.info("Post %s not found: HTTP %s", post_id, e.http_status)
+                return PostRecord(post_id, "not_found")
+            self.log.error("Failed to fetch post %s: %s", post_id, e)  # noqa: TRY400
+            return PostRecord(post_id, "fetch_error", error=str(e))
         except Exception as e:
-            self.log.error(f"Unexpected error for post {post_id}: {e}")  # noqa: TRY400
-            return {"id": post_id, "status": "error", "error": str(e)}
+            self.log.error("Unexpected error for post %s: %s", post_id, e)  # noqa: TRY400
+            return PostRecord(post_id, "error", error=str(e))
         else:
-            data["id"] = post_id
-            return data
+            return record
+
+    async def __work(self, post_ids: asyncio.Queue[int], results: asyncio.Queue[PostRecord | None]) -> None:
+        """Забирает ID статей из очереди, пока она не опустеет, и складывает результаты.
+
+        :param post_ids: Очередь ID статей для обработки
+        :type post_ids: asyncio.Queue[int]
+        :param results: Очередь результатов обработки
+        :type results: asyncio.Queue[PostRecord | None]
+        """
+        while True:
+            try:
+                post_id = post_ids.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await results.put(await self.get_post_data(post_id))
+
+    async def __consume(self, results: asyncio.Queue[PostRecord | None], exporter: Exporter, total: int) -> None:
+        """Сохраняет результаты пачками по мере их поступления, пока не придет None.
+
+        :param results: Очередь результатов обработки
+        :type results: asyncio.Queue[PostRecord | None]
+        :param exporter: Экспортер для сохранения результатов
+        :type exporter: Exporter
+        :param total: Общее количество статей
+        :type total: int
+        """
+        batch: list[dict[str, Any]] = []
+        finished: list[int] = []
+        processed = 0
+        while (result := await results.get()) is not None:
+            processed += 1
+            if not self._skip or result.status == "ok":
+                batch.append(result.to_dict())
+            if result.status in FINAL_STATUSES:
+                finished.append(result.id)
+            if processed % self._batch_size == 0 or processed == total:
+                await self.__save_batch(exporter, batch, finished)
+                batch, finished = [], []
+                self.log.info("Processed %s/%s", processed, total)
+
+        await self.__save_batch(exporter, batch, finished)
+
+    async def __save_batch(self, exporter: Exporter, batch: list[dict[str, Any]], finished: list[int]) -> None:
+        """Передает пачку результатов в экспортер и отмечает окончательно обработанные статьи.
+
+        Отметки записываются на диск каждый раз, когда экспортер сбросил в файл все полученные записи:
+        после аварийного завершения уже сохраненные статьи не будут запрошены и записаны повторно.
+
+        :param exporter: Экспортер для сохранения результатов
+        :type exporter: Exporter
+        :param batch: Результаты для сохранения
+        :type batch: list[dict[str, Any]]
+        :param finished: ID статей со статусом из FINAL_STATUSES
+        :type finished: list[int]
+        """
+        if batch:
+            await exporter.save_chunks(batch)
+        if self.seen is not None:
+            for post_id in finished:
+                self.seen.add(post_id)
+            if (batch or finished) and exporter.buffered_rows == 0:
+                await self.seen.save()
 
     async def ingest_all(self) -> None:
-        """Основной метод парсинга с улучшенным управлением скоростью."""
+        """Основной метод парсинга.
+
+        Статьи обрабатываются пулом из max_concurrent_requests воркеров, которые берут ID из общей очереди,
+        поэтому медленный запрос не задерживает остальные. Результаты сохраняются пачками по batch_size.
+        Очередь результатов ограничена несколькими пачками, поэтому медленный экспорт притормаживает
+        воркеров, а ошибка сохранения сразу останавливает парсинг.
+        """
         pages = self.config.pages
         first, last = pages.first, pages.last
-        self.log.info(f"Starting parsing from {first} to {last}!")
+        self.log.info("Starting parsing from %s to %s!", first, last)
         exporter = Exporter(
             self.save_path,
-            max_workers=self.config.request.max_workers,
             buffer_size=self.config.request.buffer_size,
+            schema=POST_SCHEMA,
+            row_group_bytes=self.config.request.row_group_bytes,
             )
 
+        post_ids: asyncio.Queue[int] = asyncio.Queue()
+        for post_id in range(first, last + 1):
+            if self.seen is None or post_id not in self.seen:
+                post_ids.put_nowait(post_id)
+        if self.seen is not None:
+            self.log.info("Skipping %s posts processed in previous runs", last - first + 1 - post_ids.qsize())
+        results: asyncio.Queue[PostRecord | None] = asyncio.Queue(maxsize=RESULTS_QUEUE_BATCHES * self._batch_size)
+        tasks: list[asyncio.Future[Any]] = []
+
         try:
             await self.init_session()
-            batch_size = self.config.request.batch_size
-            all_post_ids = list(range(first, last + 1))
-
-            for i in range(0, len(all_post_ids), batch_size):
-                batch_ids = all_post_ids[i:i + batch_size]
-
-                tasks = [self.get_post_data(pid) for pid in batch_ids]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for result in results:
-                    if isinstance(result, BaseException):
-                        continue
-                    if not self.config.save.skip or result.get("status") == "ok":
-                        await exporter.save_chunk(result)
-
-                self.log.info(f"Processed {min(i + batch_size, len(all_post_ids))}/{len(all_post_ids)}")
-
-                if i + batch_size < len(all_post_ids):
-                    await self.__delay_request()
+            consumer = asyncio.create_task(self.__consume(results, exporter, post_ids.qsize()))
+            tasks.append(consumer)
+            workers = [
+                asyncio.create_task(self.__work(post_ids, results))
+                for _ in range(self.config.request.max_concurrent_requests)
+            ]
+            tasks.extend(workers)
+            workers_done: asyncio.Future[Any] = asyncio.gather(*workers)
+            tasks.append(workers_done)
+
+            waiting: list[asyncio.Future[Any]] = [consumer, workers_done]
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if consumer in done:
+                consumer.result()
+            await results.put(None)
+            await consumer
         finally:
+            for task in tasks:
+                task.cancel()
+            # Пул процессов закрывается только после того, как отмененные воркеры завершились
+            await asyncio.gather(*tasks, return_exceptions=True)
             await self.close_session()
             await exporter.finalize()
+            # Оставшиеся отметки сохраняются только после того, как экспортер записал все на диск
+            if self.seen is not None:
+                await self.seen.save()
 
         self.log.info("Parsing completed")
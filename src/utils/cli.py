@@ -1,12 +1,22 @@
 """CLI утилиты для парсера Habr.com."""
 
 import asyncio
+from collections.abc import Callable
 from pathlib import Path
 
 import click
 
 from src.parser import HabrParser
 
+# uvloop быстрее стандартного event loop, но недоступен на Windows
+loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop
+
+    loop_factory = uvloop.new_event_loop
+except ImportError:
+    loop_factory = None
+
 
 @click.command()
 @click.option(
@@ -23,7 +33,7 @@ def cli(config: Path) -> None:
             """Корутина для париснга."""
             async with HabrParser(config) as parser:
                 await parser.ingest_all()
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         raise click.Abort from e
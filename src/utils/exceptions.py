@@ -8,11 +8,14 @@ class FetchPostError(Exception):
     :vartype post_id: int
     :ivar status_code: код статуса HTTP или описание ошибки
     :vartype status_code: str
+    :ivar http_status: код ответа HTTP, если сервер ответил
+    :vartype http_status: int | None
     """
 
-    def __init__(self, post_id: int, status_code: str) -> None:
+    def __init__(self, post_id: int, status_code: str, http_status: int | None = None) -> None:
         """Инициализация параметров."""
         error_message = f"Failed to fetch post {post_id}, status code {status_code}"
         super().__init__(error_message)
         self.post_id = post_id
         self.status_code = status_code
+        self.http_status = http_status
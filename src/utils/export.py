@@ -1,25 +1,39 @@
-"""Асинхронный модуль для экспорта данных в различные форматы (JSON, CSV, Parquet)."""
+"""Асинхронный модуль для экспорта данных в различные форматы (JSON, JSON Lines, CSV, Parquet, Feather)."""
 
 import asyncio
 import csv
-import json
-from concurrent.futures import ThreadPoolExecutor
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
 import aiofiles
-import pandas as pd
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+import zstandard
 
 if TYPE_CHECKING:
     from aiofiles.base import AiofilesContextManager
 
+OFFLOAD_THRESHOLD = 32
+FLUSH_BYTES = 1 << 20
+ROW_GROUP_BYTES = 64 << 20
+ZSTD_LEVEL = 3
+
+
 class PExporter(Protocol):
     """Протокол для классов для экспорта данных.
 
     Определяет интерфейс для классов, осуществляющих экспорт данных.
+
+    :ivar buffered_rows: сколько переданных записей еще не записано в файл
+    :vartype buffered_rows: int
     """
 
+    buffered_rows: int
+
     async def save_chunk(self, data: dict[str, Any]) -> None:
         """Асинхронно сохраняет порцию данных.
 
@@ -27,6 +41,13 @@ class PExporter(Protocol):
         :type data: dict[str, Any]
         """
 
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Асинхронно сохраняет пачку порций данных.
+
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+
     async def finalize(self) -> None:
         """Асинхронно завершает процесс экспорта и закрывает ресурсы."""
 
@@ -36,36 +57,40 @@ class Exporter:
 
     :param path: путь к файлу для экспорта
     :type path: Path
-    :param buffer_size: размер буфера для записи данных, defaults to 100
+    :param buffer_size: сколько строк копится перед записью в Parquet и Feather, defaults to 100
     :type buffer_size: int
+    :param target_bytes: сколько байт копится перед записью в JSON, JSON Lines и CSV, defaults to FLUSH_BYTES
+    :type target_bytes: int
+    :param row_group_bytes: примерный размер группы строк Parquet, defaults to ROW_GROUP_BYTES
+    :type row_group_bytes: int
+    :param schema: Arrow-схема записей для колоночных форматов, defaults to None
+    :type schema: pa.Schema | None
+    :raises ValueError: если формат не поддерживается
     """
 
-    def __init__(self, path: Path, buffer_size: int = 100, max_workers: int = 100) -> None:
+    __slots__ = ("__exporter", "buffer_size", "extension", "path", "row_group_bytes", "schema", "target_bytes")
+
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int = 100,
+        schema: pa.Schema | None = None,
+        target_bytes: int = FLUSH_BYTES,
+        row_group_bytes: int = ROW_GROUP_BYTES,
+    ) -> None:
         """Инициализация параметров."""
         self.path: Path = path
-        self.extension: str = path.suffix.lower()
+        double_suffix = "".join(path.suffixes[-2:]).lower()
+        self.extension: str = double_suffix if double_suffix in _REGISTRY else path.suffix.lower()
         self.buffer_size = buffer_size
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.__exporter: PExporter | None = None
-
-    def __get_exporter(self) -> PExporter:
-        """Получает экземпляр экспортера для соответствующего формата.
-
-        :return: экземпляр экспортера
-        :rtype: PExporter
-        :raises ValueError: если формат не поддерживается
-        """
-        if self.__exporter is None:
-            if self.extension == ".json":
-                self.__exporter = JsonExporter(self.path, self.buffer_size, self.executor)
-            elif self.extension == ".csv":
-                self.__exporter = CsvExporter(self.path, self.buffer_size, self.executor)
-            elif self.extension == ".parquet":
-                self.__exporter = ParquetExporter(self.path, self.buffer_size, self.executor)
-            else:
-                error_msg = f"Unsupported format: {self.extension}"
-                raise ValueError(error_msg)
-        return self.__exporter
+        self.target_bytes = target_bytes
+        self.row_group_bytes = row_group_bytes
+        self.schema = schema
+        factory = _REGISTRY.get(self.extension)
+        if factory is None:
+            error_msg = f"Unsupported format: {self.extension}"
+            raise ValueError(error_msg)
+        self.__exporter: PExporter = factory(self)
 
     async def save_chunk(self, data: dict[str, Any]) -> None:
         """Сохраняет порцию данных через соответствующий экспортер.
@@ -73,13 +98,28 @@ class Exporter:
         :param data: данные для сохранения
         :type data: dict[str, Any]
         """
-        await self.__get_exporter().save_chunk(data)
+        await self.__exporter.save_chunk(data)
+
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Сохраняет пачку порций данных через соответствующий экспортер.
+
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+        await self.__exporter.save_chunks(data)
+
+    @property
+    def buffered_rows(self) -> int:
+        """Сколько переданных записей еще не записано в файл.
+
+        :return: количество записей в буфере экспортера
+        :rtype: int
+        """
+        return self.__exporter.buffered_rows
 
     async def finalize(self) -> None:
         """Завершает процесс экспорта и освобождает ресурсы."""
-        if self.__exporter:
-            await self.__get_exporter().finalize()
-        self.executor.shutdown()
+        await self.__exporter.finalize()
 
 
 class JsonExporter(PExporter):
@@ -87,26 +127,25 @@ class JsonExporter(PExporter):
 
     :param path: путь к файлу для экспорта
     :type path: Path
-    :param buffer_size: размер буфера для записи данных
-    :type buffer_size: int
-    :param executor: исполнитель для потоковых операций
-    :type executor: ThreadPoolExecutor
+    :param target_bytes: сколько байт копится в буфере перед записью в файл
+    :type target_bytes: int
     """
 
-    def __init__(self, path: Path, buffer_size: int, executor: ThreadPoolExecutor) -> None:
+    def __init__(self, path: Path, target_bytes: int) -> None:
         """Инициализация параметров."""
         self.path = path.with_suffix(".json")
-        self.buffer_size: int = buffer_size
-        self.executor: ThreadPoolExecutor = executor
-        self.buffer: list[str] = []
+        self.target_bytes: int = target_bytes
+        self.buffer: list[bytes] = []
+        self.buffer_bytes: int = 0
+        self.buffered_rows: int = 0
         self.first_item: bool = True
         self.file: AiofilesContextManager | None = None
 
     async def __initialize_file(self) -> None:
         """Инициализирует файл для записи JSON данных."""
         if self.file is None:
-            self.file = await aiofiles.open(self.path, "w", encoding="utf-8")
-            await self.file.write("[\n")
+            self.file = await aiofiles.open(self.path, "wb", buffering=self.target_bytes)
+            await self.file.write(b"[\n")
 
     async def save_chunk(self, data: dict[str, Any]) -> None:
         """Сохраняет порцию данных в формате JSON.
@@ -114,64 +153,238 @@ class JsonExporter(PExporter):
         :param data: данные для сохранения
         :type data: dict[str, Any]
         """
-        await self.__initialize_file()
+        await self.save_chunks([data])
 
-        loop = asyncio.get_running_loop()
-        json_str = await loop.run_in_executor(
-            self.executor,
-            lambda: json.dumps(data, ensure_ascii=False),
-        )
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Сохраняет пачку порций данных в формате JSON.
+
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+        await self.__initialize_file()
 
-        if not self.first_item:
-            json_str = ",\n" + json_str
+        if len(data) < OFFLOAD_THRESHOLD:
+            json_items = self.__dump_items(data)
         else:
-            self.first_item = False
+            loop = asyncio.get_running_loop()
+            json_items = await loop.run_in_executor(None, self.__dump_items, data)
 
-        self.buffer.append(json_str)
+        for json_item in json_items:
+            if not self.first_item:
+                self.buffer.append(b",\n")
+            else:
+                self.first_item = False
+            self.buffer.append(json_item)
+            self.buffer_bytes += len(json_item)
+        self.buffered_rows += len(data)
 
-        if len(self.buffer) >= self.buffer_size:
+        if self.buffer_bytes >= self.target_bytes:
             await self.__flush_buffer()
 
+    @staticmethod
+    def __dump_items(data: list[dict[str, Any]]) -> list[bytes]:
+        """Сериализует записи в JSON.
+
+        :param data: список данных для сериализации
+        :type data: list[dict[str, Any]]
+        :return: JSON каждой записи
+        :rtype: list[bytes]
+        """
+        return [orjson.dumps(item) for item in data]
+
     async def __flush_buffer(self) -> None:
         """Сбрасывает буфер данных в файл."""
         if self.buffer and self.file:
-            content = "".join(self.buffer)
-            await self.file.write(content)
+            content = b"".join(self.buffer)
             self.buffer.clear()
+            self.buffer_bytes = 0
+            await self.file.write(content)
+            await self.file.flush()
+            self.buffered_rows = 0
 
     async def finalize(self) -> None:
         """Завершает запись JSON файла и закрывает ресурсы."""
         await self.__flush_buffer()
         if self.file:
-            await self.file.write("\n]")
+            await self.file.write(b"\n]")
+            await self.file.close()
+
+
+class JsonlExporter(PExporter):
+    """Экспортер данных в формате JSON Lines: одна запись на строку.
+
+    В отличие от JSON-массива, у файла нет открывающей и закрывающей скобок, поэтому он корректен
+    в любой момент записи и его можно читать потоково.
+
+    :param path: путь к файлу для экспорта
+    :type path: Path
+    :param target_bytes: сколько байт копится в буфере перед записью в файл
+    :type target_bytes: int
+    """
+
+    def __init__(self, path: Path, target_bytes: int) -> None:
+        """Инициализация параметров."""
+        self.path = path
+        self.target_bytes: int = target_bytes
+        self.buffer: list[bytes] = []
+        self.buffer_bytes: int = 0
+        self.buffered_rows: int = 0
+        self.file: AiofilesContextManager | None = None
+
+    async def __initialize_file(self) -> None:
+        """Инициализирует файл для записи данных."""
+        if self.file is None:
+            self.file = await aiofiles.open(self.path, "wb", buffering=self.target_bytes)
+
+    async def save_chunk(self, data: dict[str, Any]) -> None:
+        """Сохраняет порцию данных в формате JSON Lines.
+
+        :param data: данные для сохранения
+        :type data: dict[str, Any]
+        """
+        await self.save_chunks([data])
+
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Сохраняет пачку порций данных в формате JSON Lines.
+
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+        await self.__initialize_file()
+
+        if len(data) < OFFLOAD_THRESHOLD:
+            lines = self.__dump_lines(data)
+        else:
+            loop = asyncio.get_running_loop()
+            lines = await loop.run_in_executor(None, self.__dump_lines, data)
+
+        self.buffer.append(lines)
+        self.buffer_bytes += len(lines)
+        self.buffered_rows += len(data)
+
+        if self.buffer_bytes >= self.target_bytes:
+            await self._flush_buffer()
+
+    @staticmethod
+    def __dump_lines(data: list[dict[str, Any]]) -> bytes:
+        """Сериализует записи в строки JSON Lines.
+
+        :param data: список данных для сериализации
+        :type data: list[dict[str, Any]]
+        :return: строки JSON, каждая с переводом строки
+        :rtype: bytes
+        """
+        return b"".join(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in data)
+
+    async def _encode(self, content: bytes) -> bytes:
+        """Подготавливает содержимое буфера к записи в файл.
+
+        :param content: содержимое буфера
+        :type content: bytes
+        :return: байты для записи
+        :rtype: bytes
+        """
+        return content
+
+    async def _flush_buffer(self) -> None:
+        """Сбрасывает буфер данных в файл."""
+        if self.buffer and self.file:
+            content = b"".join(self.buffer)
+            self.buffer.clear()
+            self.buffer_bytes = 0
+            await self.file.write(await self._encode(content))
+            await self.file.flush()
+            self.buffered_rows = 0
+
+    async def finalize(self) -> None:
+        """Сбрасывает остаток буфера и закрывает файл."""
+        await self._flush_buffer()
+        if self.file:
+            await self.file.close()
+
+
+class JsonlZstdExporter(JsonlExporter):
+    """Экспортер данных в формате JSON Lines, сжатом zstd.
+
+    Строки копятся в буфере несжатыми, а при сбросе сжимаются в потоке и дописываются в файл
+    отдельным zstd-блоком, поэтому записанная часть файла читается даже после аварийного завершения.
+
+    :param path: путь к файлу для экспорта
+    :type path: Path
+    :param target_bytes: сколько несжатых байт копится в буфере перед записью в файл
+    :type target_bytes: int
+    """
+
+    def __init__(self, path: Path, target_bytes: int) -> None:
+        """Инициализация параметров."""
+        super().__init__(path, target_bytes)
+        self.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def __compress(self, content: bytes) -> bytes:
+        """Сжимает данные и завершает текущий zstd-блок.
+
+        :param content: несжатые данные
+        :type content: bytes
+        :return: сжатые данные
+        :rtype: bytes
+        """
+        return self.compressor.compress(content) + self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    async def _encode(self, content: bytes) -> bytes:
+        """Сжимает содержимое буфера в потоке.
+
+        :param content: содержимое буфера
+        :type content: bytes
+        :return: сжатые данные
+        :rtype: bytes
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__compress, content)
+
+    async def finalize(self) -> None:
+        """Завершает zstd-кадр и закрывает файл."""
+        await self._flush_buffer()
+        if self.file:
+            await self.file.write(self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH))
             await self.file.close()
 
 
 class CsvExporter(PExporter):
     """Экспортер данных в формате CSV.
 
+    Колонки фиксируются один раз: берутся из схемы, а без нее - из первой записи. Заголовок пишется
+    перед первой пачкой строк.
+
     :param path: путь к файлу для экспорта
     :type path: Path
-    :param buffer_size: размер буфера для записи данных
-    :type buffer_size: int
-    :param executor: исполнитель для потоковых операций
-    :type executor: ThreadPoolExecutor
+    :param target_bytes: сколько байт копится в буфере перед записью в файл
+    :type target_bytes: int
+    :param schema: Arrow-схема записей, defaults to None
+    :type schema: pa.Schema | None
     """
 
-    def __init__(self, path: Path, buffer_size: int, executor: ThreadPoolExecutor) -> None:
+    def __init__(
+        self,
+        path: Path,
+        target_bytes: int,
+        schema: pa.Schema | None = None,
+    ) -> None:
         """Инициализация параметров."""
         self.path = path.with_suffix(".csv")
-        self.buffer_size = buffer_size
-        self.executor = executor
-        self.fieldnames: set[str] = set()
-        self.buffer: list[str] = []
-        self.header_written = False
+        self.target_bytes = target_bytes
+        self.fieldnames: tuple[str, ...] | None = tuple(schema.names) if schema else None
+        self.buffer: list[bytes] = []
+        self.buffer_bytes: int = 0
+        self.buffered_rows: int = 0
+        self.output = StringIO()
+        self.writer = csv.writer(self.output, lineterminator="\n")
         self.file = None
 
     async def _initialize_file(self) -> None:
         """Инициализирует файл для записи CSV данных."""
         if self.file is None:
-            self.file = await aiofiles.open(self.path, "w", encoding="utf-8", newline="")
+            self.file = await aiofiles.open(self.path, "wb", buffering=self.target_bytes)
+            self.__write_header()
 
     async def save_chunk(self, data: dict[str, Any]) -> None:
         """Сохраняет порцию данных в формате CSV.
@@ -179,117 +392,309 @@ class CsvExporter(PExporter):
         :param data: данные для сохранения
         :type data: dict[str, Any]
         """
-        await self._initialize_file()
-        self.fieldnames.update(data.keys())
+        await self.save_chunks([data])
 
-        loop = asyncio.get_running_loop()
-        csv_line = await loop.run_in_executor(
-            self.executor,
-            self.__convert_to_csv_line,
-            data,
-        )
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Сохраняет пачку порций данных в формате CSV.
 
-        self.buffer.append(csv_line)
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+        if not data:
+            return
+        if self.fieldnames is None:
+            self.fieldnames = tuple(data[0])
+        await self._initialize_file()
 
-        if not self.header_written:
-            await self._write_header()
-            self.header_written = True
+        if len(data) < OFFLOAD_THRESHOLD:
+            csv_lines = self.__convert_to_csv_lines(data)
+        else:
+            loop = asyncio.get_running_loop()
+            csv_lines = await loop.run_in_executor(None, self.__convert_to_csv_lines, data)
+
+        self.buffer.append(csv_lines)
+        self.buffer_bytes += len(csv_lines)
+        self.buffered_rows += len(data)
 
-        if len(self.buffer) >= self.buffer_size:
+        if self.buffer_bytes >= self.target_bytes:
             await self.__flush_buffer()
 
-    def __convert_to_csv_line(self, data: dict[str, Any]) -> str:
-        """Конвертирует данные в CSV строку без использования DictWriter с файлом.
+    def __convert_to_csv_lines(self, data: list[dict[str, Any]]) -> bytes:
+        """Конвертирует пачку данных в CSV строки.
 
-        :param data: данные для конвертации
-        :type data: dict[str, Any]
-        :return: CSV строка
-        :rtype: str
+        :param data: список данных для конвертации
+        :type data: list[dict[str, Any]]
+        :return: CSV строки в UTF-8
+        :rtype: bytes
         """
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=self.fieldnames)
-        writer.writerow(data)
-        csv_string = output.getvalue().strip()
-        output.close()
+        fieldnames = self.fieldnames or ()
+        self.writer.writerows([item.get(name) for name in fieldnames] for item in data)
+        return self.__take_output()
 
-        return csv_string + "\n"
+    def __take_output(self) -> bytes:
+        """Забирает накопленные writer строки и очищает его буфер.
 
-    async def _write_header(self) -> None:
-        """Записывает заголовок CSV файла."""
-        if self.file:
-            loop = asyncio.get_running_loop()
-            header = await loop.run_in_executor(
-                self.executor,
-                lambda: ",".join(self.fieldnames) + "\n",
-            )
-            await self.file.write(header)
+        :return: CSV строки в UTF-8
+        :rtype: bytes
+        """
+        lines = self.output.getvalue()
+        self.output.seek(0)
+        self.output.truncate()
+        return lines.encode()
+
+    def __write_header(self) -> None:
+        """Добавляет заголовок CSV файла в начало буфера."""
+        self.writer.writerow(self.fieldnames or ())
+        self.buffer.append(self.__take_output())
 
     async def __flush_buffer(self) -> None:
         """Сбрасывает буфер данных в файл."""
         if self.buffer and self.file:
-            content = "".join(self.buffer)
-            await self.file.write(content)
+            content = b"".join(self.buffer)
             self.buffer.clear()
+            self.buffer_bytes = 0
+            await self.file.write(content)
+            await self.file.flush()
+            self.buffered_rows = 0
 
     async def finalize(self) -> None:
         """Завершает запись CSV файла и закрывает ресурсы."""
         await self.__flush_buffer()
+        self.output.close()
         if self.file:
             await self.file.close()
 
 
-class ParquetExporter(PExporter):
-    """Экспортер данных в формате Parquet.
+class ColumnarExporter(PExporter, ABC):
+    """Базовый экспортер колоночных форматов Arrow.
+
+    Данные буферизуются по колонкам и дописываются в один файл пачками по buffer_size строк
+    через writer, который создает наследник. Если схема не передана, колонки собираются из записей
+    первой пачки (недостающие значения заполняются None), а типы берутся из нее же; колонки,
+    в которых были только None, записываются как строковые. После открытия файла набор колонок
+    уже не меняется, и запись с неизвестным ключом вызывает ValueError, а не теряется молча.
+    Без футера файл не читается, поэтому все записи считаются буферизованными до finalize.
 
     :param path: путь к файлу для экспорта
     :type path: Path
     :param buffer_size: размер буфера для записи данных
     :type buffer_size: int
-    :param executor: исполнитель для потоковых операций
-    :type executor: ThreadPoolExecutor
+    :param schema: Arrow-схема записей, defaults to None
+    :type schema: pa.Schema | None
     """
 
-    def __init__(self, path: Path, buffer_size: int, executor: ThreadPoolExecutor) -> None:
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int,
+        schema: pa.Schema | None = None,
+    ) -> None:
         """Инициализация параметров."""
-        self.path = path.with_suffix(".parquet")
+        self.path = path
         self.buffer_size = buffer_size
-        self.executor = executor
-        self.data_chunks: list[dict[str, Any]] = []
+        self.schema: pa.Schema | None = schema
+        self.columns: dict[str, list[Any]] = {name: [] for name in schema.names} if schema else {}
+        self.row_count: int = 0
+        self.buffered_rows: int = 0
+        self.writer: pq.ParquetWriter | pa.ipc.RecordBatchFileWriter | None = None
+
+    @abstractmethod
+    def _open_writer(self, schema: pa.Schema) -> pq.ParquetWriter | pa.ipc.RecordBatchFileWriter:
+        """Открывает writer файла.
+
+        :param schema: схема записываемых пачек
+        :type schema: pa.Schema
+        :return: writer с методами write_batch и close
+        :rtype: pq.ParquetWriter | pa.ipc.RecordBatchFileWriter
+        """
 
     async def save_chunk(self, data: dict[str, Any]) -> None:
-        """Сохраняет порцию данных в формате Parquet.
+        """Сохраняет порцию данных.
 
         :param data: данные для сохранения
         :type data: dict[str, Any]
         """
-        self.data_chunks.append(data)
+        await self.save_chunks([data])
+
+    async def save_chunks(self, data: list[dict[str, Any]]) -> None:
+        """Сохраняет пачку порций данных.
+
+        :param data: список данных для сохранения
+        :type data: list[dict[str, Any]]
+        """
+        if not data:
+            return
+        for item in data:
+            unknown = item.keys() - self.columns.keys()
+            if not unknown:
+                continue
+            if self.schema is not None:
+                error_msg = f"Unknown columns for {self.path.name}: {', '.join(sorted(unknown))}"
+                raise ValueError(error_msg)
+            for name in unknown:
+                self.columns[name] = [None] * self.row_count
 
-        if len(self.data_chunks) >= self.buffer_size:
+        for name, column in self.columns.items():
+            column.extend(item.get(name) for item in data)
+        self.row_count += len(data)
+        self.buffered_rows += len(data)
+
+        if self.row_count >= self.buffer_size:
             await self.__save_chunks()
 
     async def __save_chunks(self) -> None:
-        """Сохраняет накопленные данные в Parquet файл."""
-        if not self.data_chunks:
+        """Сохраняет накопленные данные в файл."""
+        if not self.row_count:
             return
-        chunks_to_save = self.data_chunks.copy()
-        self.data_chunks.clear()
+        columns = self.columns
+        self.columns = {name: [] for name in columns}
+        self.row_count = 0
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(
-            self.executor,
-            self.__save_to_parquet,
-            chunks_to_save,
+            None,
+            self.__write_batch,
+            columns,
         )
 
-    def __save_to_parquet(self, data_chunks: list[dict[str, Any]]) -> None:
-        """Сохраняет данные в Parquet файл.
+    def __write_batch(self, columns: dict[str, list[Any]]) -> None:
+        """Дописывает колонки в файл одним RecordBatch.
 
-        :param data_chunks: список данных для сохранения
-        :type data_chunks: list[dict[str, Any]]
+        :param columns: данные по колонкам
+        :type columns: dict[str, list[Any]]
+        """
+        batch = pa.RecordBatch.from_pydict(columns, schema=self.schema)
+        if self.writer is None:
+            if any(pa.types.is_null(field.type) for field in batch.schema):
+                schema = pa.schema(
+                    field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in batch.schema
+                )
+                batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+            self.schema = batch.schema
+            self.writer = self._open_writer(self.schema)
+        self._write(batch)
+
+    def _write(self, batch: pa.RecordBatch) -> None:
+        """Передает пачку writer.
+
+        :param batch: пачка записей
+        :type batch: pa.RecordBatch
         """
-        if data_chunks:
-            df = pd.DataFrame(data_chunks)
-            df.to_parquet(self.path, engine="pyarrow", compression="snappy")
+        if self.writer:
+            self.writer.write_batch(batch)
+
+    def _close(self) -> None:
+        """Закрывает writer, дописывая футер файла."""
+        if self.writer:
+            self.writer.close()
 
     async def finalize(self) -> None:
-        """Завершает запись Parquet файла."""
-        await self.__save_chunks()
+        """Завершает запись файла.
+
+        Футер файла дописывается даже при ошибке последней записи, иначе файл нельзя будет прочитать.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await self.__save_chunks()
+        finally:
+            await loop.run_in_executor(None, self._close)
+        self.buffered_rows = 0
+
+
+class ParquetExporter(ColumnarExporter):
+    """Экспортер данных в формате Parquet.
+
+    Пачки по buffer_size строк сразу переводятся в Arrow, но на диск попадают группами строк
+    примерно по row_group_bytes: мелкие группы строк замедляют чтение и раздувают метаданные файла.
+
+    :param path: путь к файлу для экспорта
+    :type path: Path
+    :param buffer_size: размер буфера для записи данных
+    :type buffer_size: int
+    :param schema: Arrow-схема записей, defaults to None
+    :type schema: pa.Schema | None
+    :param row_group_bytes: примерный размер группы строк в памяти, defaults to ROW_GROUP_BYTES
+    :type row_group_bytes: int
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int,
+        schema: pa.Schema | None = None,
+        row_group_bytes: int = ROW_GROUP_BYTES,
+    ) -> None:
+        """Инициализация параметров."""
+        super().__init__(path.with_suffix(".parquet"), buffer_size, schema)
+        self.row_group_bytes = row_group_bytes
+        self.pending: list[pa.RecordBatch] = []
+        self.pending_bytes: int = 0
+
+    def _write(self, batch: pa.RecordBatch) -> None:
+        """Копит пачки и записывает их одной группой строк, когда набирается row_group_bytes.
+
+        :param batch: пачка записей
+        :type batch: pa.RecordBatch
+        """
+        self.pending.append(batch)
+        self.pending_bytes += batch.nbytes
+        if self.pending_bytes >= self.row_group_bytes:
+            self.__write_row_group()
+
+    def __write_row_group(self) -> None:
+        """Записывает накопленные пачки одной группой строк."""
+        if self.pending and self.writer:
+            table = pa.Table.from_batches(self.pending)
+            self.pending.clear()
+            self.pending_bytes = 0
+            self.writer.write_table(table, row_group_size=table.num_rows)
+
+    def _close(self) -> None:
+        """Дописывает последнюю группу строк и закрывает writer."""
+        try:
+            self.__write_row_group()
+        finally:
+            super()._close()
+
+    def _open_writer(self, schema: pa.Schema) -> pq.ParquetWriter:
+        """Открывает ``pyarrow.parquet.ParquetWriter``.
+
+        :param schema: схема записываемых пачек
+        :type schema: pa.Schema
+        :return: writer Parquet файла
+        :rtype: pq.ParquetWriter
+        """
+        return pq.ParquetWriter(self.path, schema, compression="snappy")
+
+
+class FeatherExporter(ColumnarExporter):
+    """Экспортер данных в формате Feather (файловый формат Arrow IPC).
+
+    Пачки пишутся как есть, без кодирования Parquet, и сжимаются zstd. Файл можно читать
+    через ``pyarrow.feather.read_table`` или отображать в память через ``pyarrow.memory_map``.
+    """
+
+    def _open_writer(self, schema: pa.Schema) -> pa.ipc.RecordBatchFileWriter:
+        """Открывает writer файла Arrow IPC.
+
+        :param schema: схема записываемых пачек
+        :type schema: pa.Schema
+        :return: writer Arrow IPC файла
+        :rtype: pa.ipc.RecordBatchFileWriter
+        """
+        return pa.ipc.new_file(self.path, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+
+
+_REGISTRY: dict[str, Callable[[Exporter], PExporter]] = {
+    ".json": lambda exporter: JsonExporter(exporter.path, exporter.target_bytes),
+    ".jsonl": lambda exporter: JsonlExporter(exporter.path, exporter.target_bytes),
+    ".jsonl.zst": lambda exporter: JsonlZstdExporter(exporter.path, exporter.target_bytes),
+    ".csv": lambda exporter: CsvExporter(exporter.path, exporter.target_bytes, exporter.schema),
+    ".parquet": lambda exporter: ParquetExporter(
+        exporter.path,
+        exporter.buffer_size,
+        exporter.schema,
+        exporter.row_group_bytes,
+    ),
+    ".feather": lambda exporter: FeatherExporter(exporter.path, exporter.buffer_size, exporter.schema),
+    ".arrow": lambda exporter: FeatherExporter(exporter.path, exporter.buffer_size, exporter.schema),
+}
@@ -1,8 +1,13 @@
 """Модуль для настройки системы логирования."""
 
+import atexit
 import logging
+import mmap
+import os
+import queue
 import sys
 from logging import FileHandler, StreamHandler
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from src.models.config import LoggingConfig
@@ -22,6 +27,119 @@ class Formatter(logging.Formatter):
         )
 
 
+class MmapFileHandler(FileHandler):
+    """Обработчик, дописывающий логи в файл через отображение файла в память.
+
+    Запись строки - это копирование в отображенную область без системного вызова, а на диск страницы
+    сбрасывает ядро. Файл заранее увеличивается кусками по GROWTH_SIZE байт, при закрытии лишний
+    хвост обрезается. Если процесс аварийно завершится, в конце файла останутся нулевые байты:
+    при следующем открытии запись продолжается сразу после последней строки, поверх них.
+
+    :param filename: путь к файлу лога
+    :type filename: Path
+    :param encoding: кодировка файла, defaults to "utf-8"
+    :type encoding: str
+    """
+
+    GROWTH_SIZE = 64 << 20
+    SCAN_SIZE = 1 << 20
+
+    def __init__(self, filename: Path, encoding: str = "utf-8") -> None:
+        """Инициализация параметров."""
+        super().__init__(filename, mode="a", encoding=encoding, delay=True)
+        self._fd: int = -1
+        self._map: mmap.mmap | None = None
+        self._position: int = 0
+
+    def __open_map(self) -> mmap.mmap:
+        """Открывает файл лога и отображает его в память с запасом в GROWTH_SIZE байт.
+
+        :return: отображение файла
+        :rtype: mmap.mmap
+        """
+        self._fd = os.open(self.baseFilename, os.O_RDWR | os.O_CREAT, 0o644)
+        self._position = self.__data_end()
+        return self.__remap(self._position + self.GROWTH_SIZE)
+
+    def __data_end(self) -> int:
+        """Ищет конец записанных данных, пропуская нулевые байты, оставшиеся после аварийного завершения.
+
+        :return: позиция сразу за последним ненулевым байтом
+        :rtype: int
+        """
+        end = os.fstat(self._fd).st_size
+        while end > 0:
+            start = max(end - self.SCAN_SIZE, 0)
+            os.lseek(self._fd, start, os.SEEK_SET)
+            data = os.read(self._fd, end - start).rstrip(b"\0")
+            if data:
+                return start + len(data)
+            end = start
+        return 0
+
+    def __remap(self, size: int) -> mmap.mmap:
+        """Увеличивает файл до size байт и заново отображает его в память.
+
+        :param size: новый размер файла
+        :type size: int
+        :return: отображение файла
+        :rtype: mmap.mmap
+        """
+        if self._map is not None:
+            self._map.close()
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        return self._map
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Копирует отформатированную запись в отображенный файл.
+
+        :param record: запись лога
+        :type record: logging.LogRecord
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding or "utf-8")
+            mapped = self._map or self.__open_map()
+            end = self._position + len(data)
+            if end > len(mapped):
+                mapped = self.__remap(end + self.GROWTH_SIZE)
+            mapped[self._position : end] = data
+            self._position = end
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Сбрасывает отображенные страницы на диск."""
+        self.acquire()
+        try:
+            if self._map is not None:
+                self._map.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Закрывает отображение и обрезает файл до записанных данных."""
+        self.acquire()
+        try:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._fd != -1:
+                os.ftruncate(self._fd, self._position)
+                os.close(self._fd)
+                self._fd = -1
+        finally:
+            self.release()
+        super().close()
+
+
+LOG_FOLDER = Path(__file__).resolve().parents[2] / "log"
+FORMATTER = Formatter()
+
+_listeners: list[QueueListener] = []
+
+
 def _create_handler(
     handler_type: str,
     config: LoggingConfig,
@@ -45,6 +163,8 @@ def _create_handler(
     handler: StreamHandler | FileHandler
     if handler_type == "console":
         handler = StreamHandler(sys.stdout)
+    elif handler_type == "file" and log_path and config.mmap:
+        handler = MmapFileHandler(log_path)
     elif handler_type == "file" and log_path:
         handler = FileHandler(
             filename=log_path,
@@ -60,15 +180,6 @@ def _create_handler(
     return handler
 
 
-def _get_log_folder() -> Path:
-    """Возвращает путь к папке для логов.
-
-    :return: путь к папке логов
-    :rtype: Path
-    """
-    return Path(__file__).parent.parent.parent.joinpath("log")
-
-
 def _setup_handlers(config: LoggingConfig, formatter: logging.Formatter) -> list:
     """Настраивает обработчики логов в соответствии с конфигурацией.
 
@@ -86,9 +197,8 @@ def _setup_handlers(config: LoggingConfig, formatter: logging.Formatter) -> list
         handlers.append(console_handler)
 
     if config.output in {"file", "both"}:
-        log_folder = _get_log_folder()
-        log_folder.mkdir(parents=True, exist_ok=True)
-        log_path = log_folder / config.filename
+        LOG_FOLDER.mkdir(parents=True, exist_ok=True)
+        log_path = LOG_FOLDER / config.filename
 
         file_handler = _create_handler("file", config, formatter, log_path)
         handlers.append(file_handler)
@@ -96,6 +206,40 @@ def _setup_handlers(config: LoggingConfig, formatter: logging.Formatter) -> list
     return handlers
 
 
+def _stop_listener() -> None:
+    """Останавливает фоновый поток записи логов, дописав оставшиеся в очереди записи."""
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _start_listener(handlers: list) -> QueueHandler:
+    """Запускает фоновый поток, который передает записи из очереди настоящим обработчикам.
+
+    Форматирование и запись на диск уходят из потока цикла событий: вызов логгера только кладет
+    запись в очередь.
+
+    :param handlers: настоящие обработчики логов
+    :type handlers: list
+    :return: обработчик, складывающий записи в очередь
+    :rtype: QueueHandler
+    """
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
+    return queue_handler
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logger(config: LoggingConfig | None) -> None:
     """Настраивает глобальную конфигурацию логирования.
 
@@ -106,12 +250,11 @@ def setup_logger(config: LoggingConfig | None) -> None:
         logging.basicConfig(level=logging.CRITICAL + 1)
         return
 
-    formatter = Formatter()
-    handlers = _setup_handlers(config, formatter)
+    handlers = _setup_handlers(config, FORMATTER)
 
     logging.basicConfig(
         level=config.level,
-        handlers=handlers,
+        handlers=[_start_listener(handlers)],
         encoding="utf-8",
         force=True,
     )
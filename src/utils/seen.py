@@ -0,0 +1,51 @@
+"""Модуль для учета статей, обработанных в прошлых запусках парсера."""
+
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+
+
+class SeenPosts:
+    """Множество ID обработанных статей, хранящееся в файле как битовая маска.
+
+    Бит с номером ``post_id`` выставлен, если статья уже обработана. ID статей на Habr идут подряд,
+    поэтому на миллион статей уходит около 125 КБ.
+
+    :param path: путь к файлу с битовой маской
+    :type path: Path
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Инициализация параметров."""
+        self.path: Path = path
+        self.bits: bytearray = bytearray(path.read_bytes()) if path.exists() else bytearray()
+
+    def __contains__(self, post_id: int) -> bool:
+        """Проверяет, обработана ли статья.
+
+        :param post_id: ID статьи
+        :type post_id: int
+        :return: True, если статья уже обработана
+        :rtype: bool
+        """
+        index = post_id >> 3
+        return index < len(self.bits) and bool(self.bits[index] & (1 << (post_id & 7)))
+
+    def add(self, post_id: int) -> None:
+        """Отмечает статью как обработанную.
+
+        :param post_id: ID статьи
+        :type post_id: int
+        """
+        index = post_id >> 3
+        if index >= len(self.bits):
+            self.bits.extend(bytes(index + 1 - len(self.bits)))
+        self.bits[index] |= 1 << (post_id & 7)
+
+    async def save(self) -> None:
+        """Записывает битовую маску во временный файл и атомарно подменяет им основной."""
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(bytes(self.bits))
+        await aiofiles.os.replace(tmp_path, self.path)